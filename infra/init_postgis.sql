@@ -21,6 +21,10 @@ CREATE TABLE IF NOT EXISTS tiles (
 CREATE INDEX IF NOT EXISTS idx_tiles_geometry ON tiles USING GIST (geometry);
 CREATE INDEX IF NOT EXISTS idx_tiles_status ON tiles (status);
 CREATE INDEX IF NOT EXISTS idx_tiles_priority ON tiles (priority DESC);
+-- Keyset pagination scans newest-first; mirrors the ORM __table_args__
+-- (create_all skips tables this script already provisioned)
+CREATE INDEX IF NOT EXISTS ix_tiles_created_at_id ON tiles (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_tiles_status_priority ON tiles (status, priority);
 
 -- UAVs Table
 CREATE TABLE IF NOT EXISTS uavs (
@@ -51,7 +55,7 @@ CREATE TABLE IF NOT EXISTS missions (
     tile_id VARCHAR(50) REFERENCES tiles(tile_id),
     status VARCHAR(20) DEFAULT 'pending',
     priority INTEGER DEFAULT 0,
-    waypoints JSON,
+    waypoints JSONB,
     start_time TIMESTAMP,
     end_time TIMESTAMP,
     estimated_duration INTEGER,
@@ -62,6 +66,11 @@ CREATE TABLE IF NOT EXISTS missions (
 CREATE INDEX IF NOT EXISTS idx_missions_status ON missions (status);
 CREATE INDEX IF NOT EXISTS idx_missions_uav ON missions (uav_id);
 CREATE INDEX IF NOT EXISTS idx_missions_tile ON missions (tile_id);
+-- Mirrors the ORM __table_args__: status + recency listing, and a covering
+-- index so analytics window scans over created_at stay index-only
+CREATE INDEX IF NOT EXISTS ix_missions_status_created_at ON missions (status, created_at);
+CREATE INDEX IF NOT EXISTS ix_missions_created_at_covering
+    ON missions (created_at) INCLUDE (status, end_time);
 
 -- Satellite Alerts Table
 CREATE TABLE IF NOT EXISTS sat_alerts (
@@ -77,7 +86,7 @@ CREATE TABLE IF NOT EXISTS sat_alerts (
     severity VARCHAR(20) DEFAULT 'medium',
     priority INTEGER DEFAULT 0,
     status VARCHAR(20) DEFAULT 'new',
-    metadata JSON,
+    metadata JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -85,6 +94,10 @@ CREATE INDEX IF NOT EXISTS idx_alerts_position ON sat_alerts USING GIST (positio
 CREATE INDEX IF NOT EXISTS idx_alerts_status ON sat_alerts (status);
 CREATE INDEX IF NOT EXISTS idx_alerts_priority ON sat_alerts (priority DESC);
 CREATE INDEX IF NOT EXISTS idx_alerts_type ON sat_alerts (alert_type);
+-- Mirrors the ORM __table_args__: keyset pagination plus the columns the
+-- response-time analytics read, kept index-only via INCLUDE
+CREATE INDEX IF NOT EXISTS ix_sat_alerts_created_at_id
+    ON sat_alerts (created_at, id) INCLUDE (tile_id, severity);
 
 -- Detections Table (from UAV edge inference)
 CREATE TABLE IF NOT EXISTS detections (
@@ -97,9 +110,9 @@ CREATE TABLE IF NOT EXISTS detections (
     position GEOMETRY(POINT, 4326),
     latitude DOUBLE PRECISION,
     longitude DOUBLE PRECISION,
-    bbox JSON,
+    bbox JSONB,
     image_url VARCHAR(500),
-    metadata JSON,
+    metadata JSONB,
     verified BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -109,12 +122,22 @@ CREATE INDEX IF NOT EXISTS idx_detections_type ON detections (detection_type);
 CREATE INDEX IF NOT EXISTS idx_detections_uav ON detections (uav_id);
 CREATE INDEX IF NOT EXISTS idx_detections_mission ON detections (mission_id);
 CREATE INDEX IF NOT EXISTS idx_detections_confidence ON detections (confidence DESC);
+-- GIN over JSONB metadata: containment filters (metadata @> '{...}') hit the
+-- index instead of re-parsing every row's document.
+CREATE INDEX IF NOT EXISTS ix_detections_metadata_gin ON detections USING gin (metadata);
+-- Mirrors the ORM __table_args__: keyset pagination with the analytics
+-- read set (confidence, lat/lon) carried via INCLUDE, and per-UAV history
+CREATE INDEX IF NOT EXISTS ix_detections_created_at_id
+    ON detections (created_at, id) INCLUDE (confidence, latitude, longitude);
+CREATE INDEX IF NOT EXISTS ix_detections_uav_id_created_at ON detections (uav_id, created_at);
 
 -- Telemetry Table (UAV real-time data)
+-- Telemetry is the highest-volume table; it deliberately stores only
+-- lat/lon floats (no redundant position geometry) to keep rows small and
+-- skip per-insert GiST maintenance. Build geometries on the fly if needed.
 CREATE TABLE IF NOT EXISTS telemetry (
     id SERIAL PRIMARY KEY,
     uav_id VARCHAR(50) REFERENCES uavs(uav_id),
-    position GEOMETRY(POINT, 4326),
     latitude DOUBLE PRECISION,
     longitude DOUBLE PRECISION,
     altitude DOUBLE PRECISION,
@@ -122,12 +145,16 @@ CREATE TABLE IF NOT EXISTS telemetry (
     speed DOUBLE PRECISION,
     heading DOUBLE PRECISION,
     status VARCHAR(20),
-    metadata JSON,
+    metadata JSONB,
     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX IF NOT EXISTS idx_telemetry_uav ON telemetry (uav_id);
-CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp ON telemetry (timestamp DESC);
+-- BRIN instead of btree: timestamps are append-only monotonic, so a
+-- page-range summary index stays tiny and rolling-window scans only touch
+-- pages inside the window.
+CREATE INDEX IF NOT EXISTS idx_telemetry_timestamp_brin
+    ON telemetry USING brin (timestamp) WITH (pages_per_range = 32);
 
 -- Evidence Storage Table (links to MinIO)
 CREATE TABLE IF NOT EXISTS evidence (
@@ -140,7 +167,7 @@ CREATE TABLE IF NOT EXISTS evidence (
     file_size BIGINT,
     mime_type VARCHAR(100),
     checksum VARCHAR(100),
-    metadata JSON,
+    metadata JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -199,15 +226,19 @@ CREATE OR REPLACE FUNCTION find_nearest_uav(
     battery_level DOUBLE PRECISION
 ) AS $$
 BEGIN
+    -- Order by the KNN operator (<->) so the GiST index on position drives
+    -- the nearest-neighbour search instead of computing haversine for the
+    -- whole fleet; the returned distance stays in km for callers.
     RETURN QUERY
-    SELECT 
+    SELECT
         u.uav_id,
         haversine_distance(u.latitude, u.longitude, target_lat, target_lon) as dist,
         u.battery_level
     FROM uavs u
     WHERE u.status = 'available'
         AND u.battery_level >= min_battery
-    ORDER BY dist ASC
+        AND u.position IS NOT NULL
+    ORDER BY u.position <-> ST_SetSRID(ST_MakePoint(target_lon, target_lat), 4326)
     LIMIT 1;
 END;
 $$ LANGUAGE plpgsql;
@@ -244,6 +275,55 @@ SELECT
 FROM detections
 GROUP BY detection_type;
 
+-- Hourly pre-aggregates for dashboard analytics. Rolling-window reads sum a
+-- few hundred MV rows instead of re-scanning the raw tables per request.
+-- The scheduler refreshes these every minute; REFRESH MATERIALIZED VIEW
+-- CONCURRENTLY requires the unique indexes below.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_hourly_detections AS
+SELECT
+    date_trunc('hour', created_at) AS hour,
+    COALESCE(uav_id, 'unknown') AS uav_id,
+    detection_type,
+    floor(latitude / 0.01) * 0.01 AS lat_bin,
+    floor(longitude / 0.01) * 0.01 AS lon_bin,
+    COUNT(*) AS detection_count,
+    AVG(confidence) AS avg_confidence
+FROM detections
+WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+GROUP BY 1, 2, 3, 4, 5;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_hourly_detections
+    ON mv_hourly_detections (hour, uav_id, detection_type, lat_bin, lon_bin);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_hourly_alerts AS
+SELECT
+    date_trunc('hour', created_at) AS hour,
+    alert_type,
+    COALESCE(severity, 'medium') AS severity,
+    COALESCE(status, 'new') AS status,
+    COUNT(*) AS alert_count
+FROM sat_alerts
+GROUP BY 1, 2, 3, 4;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_hourly_alerts
+    ON mv_hourly_alerts (hour, alert_type, severity, status);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_hourly_missions AS
+SELECT
+    date_trunc('hour', created_at) AS hour,
+    COALESCE(status, 'pending') AS status,
+    COUNT(*) AS mission_count,
+    AVG(EXTRACT(EPOCH FROM end_time - created_at))
+        FILTER (WHERE end_time IS NOT NULL) AS avg_response_s,
+    percentile_cont(0.95) WITHIN GROUP
+        (ORDER BY EXTRACT(EPOCH FROM end_time - created_at))
+        FILTER (WHERE end_time IS NOT NULL) AS p95_response_s
+FROM missions
+GROUP BY 1, 2;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_hourly_missions
+    ON mv_hourly_missions (hour, status);
+
 -- Insert comments for documentation
 COMMENT ON TABLE tiles IS 'Geographic tiles for satellite monitoring coverage';
 COMMENT ON TABLE uavs IS 'UAV fleet registry and status';
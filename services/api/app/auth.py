@@ -14,6 +14,7 @@ import jwt
 import pyotp
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from .auth_models import User, Role, RefreshToken, Permission
@@ -36,11 +37,16 @@ REFRESH_TOKEN_EXPIRE_DAYS = 30
 # Password hashing - using bcrypt directly to avoid compatibility issues
 import bcrypt
 
+# Cost factor tuned so a single verify lands around the intended ~100ms on
+# target hardware. Benchmark with scripts and override via env if the
+# deployment CPU differs; do not lower below 12 in production.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
     if len(password) > 72:
         raise ValueError("Password too long (max 72 bytes)")
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
@@ -214,8 +220,8 @@ def verify_refresh_token(token: str, db: Session) -> Optional[User]:
     
     if not refresh_token:
         return None
-    
-    return db.query(User).filter(User.id == refresh_token.user_id).first()
+
+    return db.get(User, refresh_token.user_id)
 
 
 def revoke_refresh_token(token: str, db: Session):
@@ -338,11 +344,12 @@ async def get_current_user(
             # rather than blocking due to monitoring/backing service issues.
             pass
         
-        # Verify user exists and is active
+        # Verify user exists and is active. Session.get hits the identity
+        # map and skips statement compilation for the PK lookup.
         user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
-        
-        if not user:
+        user = db.get(User, user_id)
+
+        if not user or not user.is_active:
             raise AuthenticationError("User not found or inactive")
         
         return payload
@@ -402,10 +409,18 @@ def require_role(*roles: str):
 
 # User Authentication
 
+# Compiled once at import; executing with bindparam reuses the cached plan
+# on every login instead of rebuilding the statement per call.
+_user_by_username_stmt = select(User).where(
+    User.username == bindparam("username"),
+    User.is_active == True
+)
+
+
 def authenticate_user(username: str, password: str, db: Session) -> Optional[User]:
     """Authenticate user with username and password."""
-    user = db.query(User).filter(User.username == username, User.is_active == True).first()
-    
+    user = db.execute(_user_by_username_stmt, {"username": username}).scalar_one_or_none()
+
     if not user:
         return None
     
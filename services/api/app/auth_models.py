@@ -5,9 +5,9 @@ Implements user management, roles, permissions, and audit logging
 as specified in Appendix D: Security Plan.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, JSON, Text, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, Table, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from enum import Enum
 
 from .database import Base
@@ -90,8 +90,8 @@ class User(Base):
     consent_updated_at = Column(DateTime)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     roles = relationship("Role", secondary=user_roles, back_populates="users")
@@ -106,11 +106,11 @@ class Role(Base):
     id = Column(String(50), primary_key=True)
     name = Column(String(50), unique=True, nullable=False, index=True)
     description = Column(Text)
-    permissions = Column(JSON, nullable=False)  # List of Permission enums
+    permissions = Column(JSONB, nullable=False)  # List of Permission enums
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     users = relationship("User", secondary=user_roles, back_populates="roles")
@@ -125,7 +125,7 @@ class RefreshToken(Base):
     token_hash = Column(String(255), nullable=False, unique=True, index=True)
     expires_at = Column(DateTime, nullable=False, index=True)
     revoked = Column(Boolean, default=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="refresh_tokens")
@@ -134,9 +134,14 @@ class RefreshToken(Base):
 class AuditLog(Base):
     """Audit log entries for security monitoring."""
     __tablename__ = "audit_logs"
-    
+    __table_args__ = (
+        # GDPR export and per-user history read one user's rows in
+        # timestamp order; the composite index serves both without a sort
+        Index("ix_audit_logs_user_id_timestamp", "user_id", "timestamp"),
+    )
+
     id = Column(String(50), primary_key=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    timestamp = Column(DateTime, server_default=func.now(), index=True)
     user_id = Column(String(50), ForeignKey("users.id"), index=True)
     username = Column(String(100))
     action = Column(String(50), nullable=False, index=True)
@@ -145,8 +150,13 @@ class AuditLog(Base):
     ip_address = Column(String(50))
     user_agent = Column(Text)
     status = Column(String(20), nullable=False)  # success, failure
-    details = Column(JSON)
+    details = Column(JSONB)
     request_id = Column(String(50), index=True)
+    # Tamper-evidence chain: row_hash covers prev_hash plus the row's
+    # canonical fields, so an in-place edit or deletion breaks every
+    # later row's hash
+    prev_hash = Column(String(64))
+    row_hash = Column(String(64))
     
     # Relationships
     user = relationship("User", back_populates="audit_logs")
@@ -162,7 +172,7 @@ class Zone(Base):
     description = Column(Text)
     
     # Geometry
-    geometry = Column(JSON, nullable=False)  # GeoJSON polygon
+    geometry = Column(JSONB, nullable=False)  # GeoJSON polygon
     center_lat = Column(Float)
     center_lon = Column(Float)
     area_km2 = Column(Float)
@@ -180,11 +190,11 @@ class Zone(Base):
     alert_on_entry = Column(Boolean, default=False)
     
     # Metadata (renamed to avoid SQLAlchemy reserved word)
-    zone_metadata = Column(JSON)
+    zone_metadata = Column(JSONB)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
 
 class SystemConfig(Base):
@@ -193,9 +203,9 @@ class SystemConfig(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     key = Column(String(100), unique=True, nullable=False, index=True)
-    value = Column(JSON, nullable=False)
+    value = Column(JSONB, nullable=False)
     description = Column(Text)
     category = Column(String(50), index=True)
     is_encrypted = Column(Boolean, default=False)
     updated_by = Column(String(50))
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
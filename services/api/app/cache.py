@@ -0,0 +1,104 @@
+"""
+Response Caching Utilities.
+
+Short-TTL cache for hot, slow-changing GET endpoints (tiles, UAVs, alerts,
+system stats). Uses Redis when `REDIS_URL` is configured, falling back to an
+in-process store otherwise (same pattern as the access-token blacklist in
+`auth.py`). Values are stored as orjson bytes so a cache hit skips both the
+database round trip and most of the serialization work.
+"""
+
+import os
+import time
+import logging
+
+import orjson
+
+try:
+    import redis as _redis  # optional
+except Exception:
+    _redis = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """TTL cache for JSON-serializable endpoint payloads.
+
+    Keys are namespaced as `"<namespace>:<rest>"` so writers can invalidate
+    a whole namespace (e.g. every cached alerts page) after a mutation.
+    """
+
+    def __init__(self, default_ttl: int = 10, prefix: str = "respcache"):
+        self.default_ttl = default_ttl
+        self.prefix = prefix
+        self._use_redis = False
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and _redis is not None:
+            try:
+                self._redis = _redis.from_url(redis_url)
+                self._use_redis = True
+            except Exception:
+                self._use_redis = False
+
+        # In-memory store: key -> (expiry_timestamp, payload_bytes)
+        self._store = {}
+
+    def _full_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str):
+        """Return the cached payload for `key`, or None on miss/expiry."""
+        if self._use_redis:
+            try:
+                raw = self._redis.get(self._full_key(key))
+                return orjson.loads(raw) if raw is not None else None
+            except Exception:
+                # Cache failures must never break reads
+                return None
+
+        entry = self._store.get(key)
+        if not entry:
+            return None
+        expires_at, raw = entry
+        if expires_at < time.monotonic():
+            self._store.pop(key, None)
+            return None
+        return orjson.loads(raw)
+
+    def set(self, key: str, value, ttl: int = None):
+        """Cache `value` (must be orjson-serializable) under `key`."""
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            raw = orjson.dumps(value)
+        except Exception:
+            logger.debug("Refusing to cache non-serializable payload for %s", key)
+            return
+
+        if self._use_redis:
+            try:
+                self._redis.setex(self._full_key(key), ttl, raw)
+            except Exception:
+                pass
+        else:
+            self._store[key] = (time.monotonic() + ttl, raw)
+
+    def invalidate(self, namespace: str):
+        """Drop every cached entry whose key starts with `namespace:`."""
+        if self._use_redis:
+            try:
+                pattern = f"{self.prefix}:{namespace}:*"
+                keys = list(self._redis.scan_iter(match=pattern))
+                if keys:
+                    self._redis.delete(*keys)
+            except Exception:
+                pass
+        else:
+            prefix = f"{namespace}:"
+            for key in [k for k in self._store if k.startswith(prefix)]:
+                self._store.pop(key, None)
+
+
+# Global response cache instance
+response_cache = ResponseCache()
@@ -26,6 +26,18 @@ def _parse_bool(s: str) -> bool:
 # Read once at import-time
 DEV_MODE = _parse_bool(os.getenv("DEV_MODE", "true"))
 
+# When true, each worker runs Base.metadata.create_all at startup. Handy in
+# dev (no migration step), but with N workers it multiplies the pg_catalog
+# introspection storm at boot -- set to false in production and manage the
+# schema at deploy time instead.
+AUTO_CREATE_TABLES = _parse_bool(os.getenv("AUTO_CREATE_TABLES", "true"))
+
+# Database connection pool sizing. The SQLAlchemy defaults (5+10) collapse
+# into serialized waits under load; size to workers x expected concurrency.
+POOL_SIZE = int(os.getenv("POOL_SIZE", "25"))
+MAX_OVERFLOW = int(os.getenv("MAX_OVERFLOW", "25"))
+POOL_RECYCLE_SECONDS = int(os.getenv("POOL_RECYCLE_SECONDS", "1800"))
+
 # Alerting Configuration
 SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from geoalchemy2 import Geometry
 
 from .database import Base
@@ -12,6 +12,12 @@ from .auth_models import User, Role, RefreshToken, AuditLog, Zone, SystemConfig,
 class Tile(Base):
     """Geographic tiles for satellite monitoring coverage."""
     __tablename__ = "tiles"
+    __table_args__ = (
+        # Keyset pagination scans newest-first
+        Index("ix_tiles_created_at_id", "created_at", "id", postgresql_using="btree"),
+        # get_tiles filters status + priority_min together
+        Index("ix_tiles_status_priority", "status", "priority"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tile_id = Column(String(50), unique=True, nullable=False, index=True)
@@ -20,8 +26,8 @@ class Tile(Base):
     center_lon = Column(Float, nullable=False)
     priority = Column(Integer, default=0, index=True)
     status = Column(String(20), default="unmonitored", index=True)  # unmonitored, monitored, investigating
-    last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    last_updated = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     missions = relationship("Mission", back_populates="tile")
     alerts = relationship("SatelliteAlert", back_populates="tile")
@@ -41,30 +47,45 @@ class UAV(Base):
     battery_level = Column(Float, default=100.0, index=True)
     status = Column(String(20), default="available", index=True)  # available, assigned, in_mission, returning, charging
     mission_id = Column(Integer)
-    last_seen = Column(DateTime, default=datetime.utcnow)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    last_seen = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     missions = relationship("Mission", back_populates="uav")
     detections = relationship("Detection", back_populates="uav")
-    telemetry = relationship("Telemetry", back_populates="uav")
+    # Telemetry grows without bound (many rows per UAV per minute); a lazy
+    # load of this collection would drag the whole history into memory, so
+    # accidental traversal raises instead. Query Telemetry directly with a
+    # window/limit, or use an explicit eager-load option if ever needed.
+    telemetry = relationship("Telemetry", back_populates="uav", lazy="raise")
 
 
 class Mission(Base):
     """UAV mission assignments and tracking."""
     __tablename__ = "missions"
+    __table_args__ = (
+        # get_missions filters by status and orders by created_at desc
+        Index("ix_missions_status_created_at", "status", "created_at"),
+        # Analytics aggregates filter a created_at window and read only
+        # status/end_time; INCLUDE makes that an index-only scan
+        Index(
+            "ix_missions_created_at_covering",
+            "created_at",
+            postgresql_include=["status", "end_time"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     mission_id = Column(String(50), unique=True, nullable=False, index=True)
-    uav_id = Column(String(50), ForeignKey("uavs.uav_id"))
-    tile_id = Column(String(50), ForeignKey("tiles.tile_id"))
+    uav_id = Column(String(50), ForeignKey("uavs.uav_id"), index=True)
+    tile_id = Column(String(50), ForeignKey("tiles.tile_id"), index=True)
     status = Column(String(20), default="pending", index=True)  # pending, assigned, active, completed, failed
     priority = Column(Integer, default=0)
-    waypoints = Column(JSON)
+    waypoints = Column(JSONB)
     start_time = Column(DateTime)
     end_time = Column(DateTime)
     estimated_duration = Column(Integer)  # in seconds
     actual_duration = Column(Integer)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     uav = relationship("UAV", back_populates="missions")
     tile = relationship("Tile", back_populates="missions")
@@ -74,10 +95,22 @@ class Mission(Base):
 class SatelliteAlert(Base):
     """Satellite detection alerts requiring UAV verification."""
     __tablename__ = "sat_alerts"
+    __table_args__ = (
+        # Keyset pagination scans newest-first; INCLUDE carries the columns
+        # the response-time analytics read so their window scans stay on
+        # the index instead of visiting the heap
+        Index(
+            "ix_sat_alerts_created_at_id",
+            "created_at",
+            "id",
+            postgresql_using="btree",
+            postgresql_include=["tile_id", "severity"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     alert_id = Column(String(50), unique=True, nullable=False, index=True)
-    tile_id = Column(String(50), ForeignKey("tiles.tile_id"))
+    tile_id = Column(String(50), ForeignKey("tiles.tile_id"), index=True)
     alert_type = Column(String(50), nullable=False, index=True)
     event_type = Column(String(50))
     confidence = Column(Float)
@@ -87,8 +120,8 @@ class SatelliteAlert(Base):
     severity = Column(String(20), default="medium")  # low, medium, high, critical
     priority = Column(Integer, default=0, index=True)
     status = Column(String(20), default="new", index=True)  # new, assigned, investigating, verified, false_positive
-    meta_data = Column("metadata", JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    meta_data = Column("metadata", JSONB)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     tile = relationship("Tile", back_populates="alerts")
 
@@ -96,21 +129,38 @@ class SatelliteAlert(Base):
 class Detection(Base):
     """UAV edge inference detections (YOLOv8 results)."""
     __tablename__ = "detections"
+    __table_args__ = (
+        # Keyset pagination scans newest-first; the INCLUDE payload carries
+        # what the analytics window scans read (confidence for the
+        # detection-rate/false-positive counts, lat/lon for heatmap grid
+        # binning) so both stay index-only
+        Index(
+            "ix_detections_created_at_id",
+            "created_at",
+            "id",
+            postgresql_using="btree",
+            postgresql_include=["confidence", "latitude", "longitude"],
+        ),
+        # Per-UAV detection history ordered by recency
+        Index("ix_detections_uav_id_created_at", "uav_id", "created_at"),
+        # JSONB containment filters (metadata @> '{...}') for analytics
+        Index("ix_detections_metadata_gin", "metadata", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     detection_id = Column(String(50), unique=True, nullable=False, index=True)
-    uav_id = Column(String(50), ForeignKey("uavs.uav_id"))
-    mission_id = Column(String(50), ForeignKey("missions.mission_id"))
+    uav_id = Column(String(50), ForeignKey("uavs.uav_id"), index=True)
+    mission_id = Column(String(50), ForeignKey("missions.mission_id"), index=True)
     detection_type = Column(String(50), nullable=False, index=True)  # person, vehicle, fire, etc.
     confidence = Column(Float, nullable=False, index=True)
     position = Column(Geometry('POINT', srid=4326))
     latitude = Column(Float)
     longitude = Column(Float)
-    bbox = Column(JSON)  # Bounding box coordinates
+    bbox = Column(JSONB)  # Bounding box coordinates
     image_url = Column(String(500))
-    meta_data = Column("metadata", JSON)
+    meta_data = Column("metadata", JSONB)
     verified = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     uav = relationship("UAV", back_populates="detections")
     mission = relationship("Mission", back_populates="detections")
@@ -120,10 +170,25 @@ class Detection(Base):
 class Telemetry(Base):
     """Real-time UAV telemetry data."""
     __tablename__ = "telemetry"
+    __table_args__ = (
+        # Rolling-window scans (timestamp > now() - interval) over an
+        # append-only table: BRIN is orders of magnitude smaller than a
+        # btree and prunes by page range, so scan cost tracks the window
+        # size rather than total history
+        Index(
+            "ix_telemetry_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    uav_id = Column(String(50), ForeignKey("uavs.uav_id"))
-    position = Column(Geometry('POINT', srid=4326))
+    uav_id = Column(String(50), ForeignKey("uavs.uav_id"), index=True)
+    # Unlike the other geo models, telemetry carries no position geometry:
+    # nothing queries it spatially, and at telemetry volumes the extra bytes
+    # plus GiST maintenance per insert dominate. lat/lon floats are what all
+    # consumers read; build a geometry on the fly if a query ever needs one.
     latitude = Column(Float)
     longitude = Column(Float)
     altitude = Column(Float)
@@ -131,8 +196,8 @@ class Telemetry(Base):
     speed = Column(Float)
     heading = Column(Float)
     status = Column(String(20))
-    meta_data = Column(JSON)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    meta_data = Column(JSONB)
+    timestamp = Column(DateTime, server_default=func.now())
 
     uav = relationship("UAV", back_populates="telemetry")
 
@@ -143,15 +208,15 @@ class Evidence(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     evidence_id = Column(String(50), unique=True, nullable=False, index=True)
-    detection_id = Column(String(50), ForeignKey("detections.detection_id"))
-    mission_id = Column(String(50), ForeignKey("missions.mission_id"))
+    detection_id = Column(String(50), ForeignKey("detections.detection_id"), index=True)
+    mission_id = Column(String(50), ForeignKey("missions.mission_id"), index=True)
     evidence_type = Column(String(50), nullable=False, index=True)  # image, video, log, etc.
     storage_path = Column(String(500), nullable=False)
     file_size = Column(Integer)
     mime_type = Column(String(100))
     checksum = Column(String(100))
-    meta_data = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    meta_data = Column(JSONB)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     detection = relationship("Detection", back_populates="evidence")
 
@@ -1,51 +1,161 @@
-import paho.mqtt.client as mqtt
-import json
-import os
+import collections
 import logging
+import os
+import queue
+import threading
+import time
+
+import orjson
+import paho.mqtt.client as mqtt
+from sqlalchemy import insert
+
+from .database import engine
+from .models import Telemetry
 
 logger = logging.getLogger(__name__)
 
+# Telemetry flush cadence and buffer bound. 250ms keeps rows near-real-time
+# while amortizing the insert cost over the whole batch; the bounded buffer
+# drops the oldest samples if the flusher ever falls behind the broker.
+TELEMETRY_FLUSH_INTERVAL_S = 0.25
+TELEMETRY_BUFFER_SIZE = 50000
+
+# Bound on raw messages awaiting dispatch off the paho network thread;
+# overflow drops the newest message (backpressure toward the broker's
+# queued-QoS-1 redelivery rather than unbounded memory growth).
+MESSAGE_QUEUE_SIZE = 10000
+
 
 class MQTTClient:
     def __init__(self):
         self.broker = os.getenv("MQTT_BROKER", "mosquitto")
         self.port = int(os.getenv("MQTT_PORT", "1883"))
-        self.client = mqtt.Client(client_id="api_service", clean_session=True)
+        # One fixed ClientID across N uvicorn workers makes the broker drop
+        # the previous holder on every new connect, so the workers endlessly
+        # take the session over from each other and the subscription (and
+        # QoS-1 publish pipeline) bounces between processes. Give each
+        # process its own id; the shared subscription group in on_connect
+        # keeps ingestion single-consumer across the pool.
+        self.client = mqtt.Client(
+            client_id=f"api_service_{os.getpid()}", protocol=mqtt.MQTTv5
+        )
+        # Defaults (20 inflight, unbounded-blocking queue) stall the QoS-1
+        # publish pipeline under burst load; widen the client-side window.
+        self.client.max_inflight_messages_set(1000)
+        self.client.max_queued_messages_set(100000)
         self.client.on_connect = self.on_connect
         self.client.on_message = self.on_message
         self.connected = False
+        # Telemetry arrives far faster than a per-message INSERT can keep up;
+        # buffer rows and write them as one batched statement per interval.
+        self._telemetry_buffer = collections.deque(maxlen=TELEMETRY_BUFFER_SIZE)
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        # paho invokes on_message on its single network thread; parsing and
+        # handling there serializes the entire ingress stream. The network
+        # thread only enqueues raw messages; a dispatcher thread does the rest.
+        self._messages = queue.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+        self._dispatcher = None
+        self._dispatcher_lock = threading.Lock()
 
-    def on_connect(self, client, userdata, flags, rc):
+    def on_connect(self, client, userdata, flags, rc, properties=None):
         if rc == 0:
             self.connected = True
             logger.info(f"✅ Connected to MQTT broker at {self.broker}:{self.port}")
-            # Subscribe to relevant topics
-            self.client.subscribe("telemetry/#")
-            self.client.subscribe("detections/#")
+            # Shared subscriptions (MQTTv5): the broker delivers each message
+            # to exactly one member of the group, so N workers ingest the
+            # stream once collectively instead of N times over
+            self.client.subscribe("$share/api/telemetry/#")
+            self.client.subscribe("$share/api/detections/#")
         else:
             self.connected = False
             logger.error(f"❌ Failed to connect to MQTT broker, return code {rc}")
 
     def on_message(self, client, userdata, msg):
+        # Keep the network thread free: enqueue and return. Drop the newest
+        # message if the dispatcher cannot keep up.
         try:
-            payload = json.loads(msg.payload.decode())
-            logger.debug(f"Received message on topic {msg.topic}: {payload}")
-            
-            # Handle telemetry updates
-            if msg.topic.startswith("telemetry/"):
-                self.handle_telemetry(msg.topic, payload)
-            
-            # Handle detection events
-            elif msg.topic.startswith("detections/"):
-                self.handle_detection(msg.topic, payload)
-                
-        except Exception as e:
-            logger.error(f"Error processing MQTT message: {e}")
+            self._messages.put_nowait((msg.topic, msg.payload))
+        except queue.Full:
+            logger.warning(f"MQTT message queue full, dropping message on {msg.topic}")
+
+    def _ensure_dispatcher(self):
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            return
+        with self._dispatcher_lock:
+            if self._dispatcher is None or not self._dispatcher.is_alive():
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, name="mqtt-dispatch", daemon=True
+                )
+                self._dispatcher.start()
+
+    def _dispatch_loop(self):
+        while True:
+            topic, raw = self._messages.get()
+            try:
+                # orjson parses the raw bytes directly; no intermediate str
+                payload = orjson.loads(raw)
+                logger.debug(f"Received message on topic {topic}: {payload}")
+
+                # Handle telemetry updates
+                if topic.startswith("telemetry/"):
+                    self.handle_telemetry(topic, payload)
+
+                # Handle detection events
+                elif topic.startswith("detections/"):
+                    self.handle_detection(topic, payload)
+
+            except Exception as e:
+                logger.error(f"Error processing MQTT message: {e}")
+            finally:
+                self._messages.task_done()
 
     def handle_telemetry(self, topic, payload):
-        """Handle incoming telemetry data."""
-        # This could update UAV status in database
-        pass
+        """Buffer incoming telemetry for batched insertion."""
+        topic_uav = topic.split("/", 1)[1] if "/" in topic else None
+        self._telemetry_buffer.append({
+            "uav_id": payload.get("uav_id", topic_uav),
+            "latitude": payload.get("latitude"),
+            "longitude": payload.get("longitude"),
+            "altitude": payload.get("altitude"),
+            "battery_level": payload.get("battery_level"),
+            "speed": payload.get("speed"),
+            "heading": payload.get("heading"),
+            "status": payload.get("status"),
+        })
+        self._ensure_flusher()
+
+    def _ensure_flusher(self):
+        if self._flusher is not None and self._flusher.is_alive():
+            return
+        with self._flusher_lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="telemetry-flush", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(TELEMETRY_FLUSH_INTERVAL_S)
+            self._flush_telemetry()
+
+    def _flush_telemetry(self):
+        batch = []
+        while self._telemetry_buffer:
+            try:
+                batch.append(self._telemetry_buffer.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return
+        try:
+            # Core executemany batches the whole interval into a handful of
+            # multi-row INSERTs instead of one round trip per message.
+            with engine.begin() as conn:
+                conn.execute(insert(Telemetry), batch)
+        except Exception as e:
+            logger.error(f"Failed to flush {len(batch)} telemetry rows: {e}")
 
     def handle_detection(self, topic, payload):
         """Handle incoming detection events."""
@@ -54,7 +164,11 @@ class MQTTClient:
 
     def connect(self):
         try:
-            self.client.connect(self.broker, self.port, 60)
+            self._ensure_dispatcher()
+            # Per-process client ids are ephemeral: a persistent session per
+            # pid would strand subscription state on the broker after every
+            # restart, so start clean and resubscribe in on_connect
+            self.client.connect(self.broker, self.port, 60, clean_start=True)
             self.client.loop_start()
             logger.info(f"MQTT client connecting to {self.broker}:{self.port}...")
         except Exception as e:
@@ -68,38 +182,40 @@ class MQTTClient:
 
     def publish_alert(self, alert_id: int, alert_data: dict):
         """Publish satellite alert to priority queue for scheduler."""
+        if not self.connected:
+            logger.warning("MQTT not connected, cannot publish alert")
+            return
+
         topic = "satellite/alerts"
         message = {
             "alert_id": alert_id,
             "timestamp": alert_data.get("created_at", ""),
             **alert_data
         }
-        
-        if self.connected:
-            result = self.client.publish(topic, json.dumps(message), qos=1)
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                logger.info(f"📡 Published alert {alert_id} to topic {topic}")
-            else:
-                logger.error(f"Failed to publish alert {alert_id}")
+
+        result = self.client.publish(topic, orjson.dumps(message), qos=1)
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            logger.info(f"📡 Published alert {alert_id} to topic {topic}")
         else:
-            logger.warning("MQTT not connected, cannot publish alert")
+            logger.error(f"Failed to publish alert {alert_id}")
 
     def publish_command(self, uav_id: str, command: dict):
         """Publish command to specific UAV."""
+        if not self.connected:
+            logger.warning("MQTT not connected, cannot publish command")
+            return
+
         topic = f"commands/{uav_id}"
         message = {
             "timestamp": command.get("timestamp", ""),
             **command
         }
-        
-        if self.connected:
-            result = self.client.publish(topic, json.dumps(message), qos=1)
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                logger.info(f"🚁 Published command to UAV {uav_id} on topic {topic}")
-            else:
-                logger.error(f"Failed to publish command to UAV {uav_id}")
+
+        result = self.client.publish(topic, orjson.dumps(message), qos=1)
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            logger.info(f"🚁 Published command to UAV {uav_id} on topic {topic}")
         else:
-            logger.warning("MQTT not connected, cannot publish command")
+            logger.error(f"Failed to publish command to UAV {uav_id}")
 
     def publish_uav_command(self, uav_id: str, command: dict):
         """Alias for backward compatibility."""
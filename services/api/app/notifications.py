@@ -1,9 +1,11 @@
 import logging
+import queue
 import smtplib
 import json
+import threading
 import requests
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from requests.adapters import HTTPAdapter
+from email.message import EmailMessage
 from .config import (
     SMTP_SERVER, SMTP_PORT, SMTP_USER, SMTP_PASSWORD,
     SLACK_WEBHOOK_URL, ENABLE_EMAIL_ALERTS, ENABLE_SLACK_ALERTS
@@ -13,30 +15,75 @@ logger = logging.getLogger(__name__)
 
 class NotificationManager:
     def __init__(self):
-        pass
+        # One Session with a keep-alive pool: each webhook post reuses a
+        # warm TLS connection instead of paying the full TCP+TLS handshake
+        # (hundreds of ms) per alert.
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+        # Bounded dispatch queue drained by one daemon thread: callers
+        # enqueue and return immediately instead of waiting out SMTP/Slack
+        # round trips (1-5s each). Overflow drops the oldest alert.
+        self._queue = queue.Queue(maxsize=1000)
+        self._worker = None
+        self._worker_lock = threading.Lock()
 
     def send_alert(self, subject: str, message: str, recipients: list = None):
-        """Dispatch alerts to configured channels."""
-        if ENABLE_EMAIL_ALERTS and recipients:
-            self.send_email(subject, message, recipients)
-        
-        if ENABLE_SLACK_ALERTS:
-            self.send_slack(f"*{subject}*\n{message}")
+        """Queue an alert for asynchronous dispatch to configured channels."""
+        self._ensure_worker()
+        item = (subject, message, recipients)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()  # drop oldest under overload
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                logger.warning("Notification queue full; alert dropped")
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain, name="notification-dispatch", daemon=True
+                )
+                self._worker.start()
+
+    def _drain(self):
+        while True:
+            subject, message, recipients = self._queue.get()
+            try:
+                if ENABLE_EMAIL_ALERTS and recipients:
+                    self.send_email(subject, message, recipients)
+
+                if ENABLE_SLACK_ALERTS:
+                    self.send_slack(f"*{subject}*\n{message}")
+            except Exception:
+                logger.exception("Notification dispatch failed")
+            finally:
+                self._queue.task_done()
 
     def send_email(self, subject: str, body: str, recipients: list):
         try:
-            msg = MIMEMultipart()
+            # Flat EmailMessage instead of a MIMEMultipart tree: single-part
+            # plain-text mail needs no multipart scaffolding, and
+            # send_message serializes straight to bytes without the
+            # as_string round trip
+            msg = EmailMessage()
             msg['From'] = SMTP_USER
             msg['To'] = ", ".join(recipients)
             msg['Subject'] = f"[EVENT SYSTEM] {subject}"
-
-            msg.attach(MIMEText(body, 'plain'))
+            msg.set_content(body)
 
             server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
             server.starttls()
             server.login(SMTP_USER, SMTP_PASSWORD)
-            text = msg.as_string()
-            server.sendmail(SMTP_USER, recipients, text)
+            server.send_message(msg, SMTP_USER, recipients)
             server.quit()
             logger.info("📧 Email alert sent successfully.")
         except Exception as e:
@@ -48,7 +95,7 @@ class NotificationManager:
             
         try:
             payload = {"text": message}
-            response = requests.post(SLACK_WEBHOOK_URL, json=payload)
+            response = self._http.post(SLACK_WEBHOOK_URL, json=payload, timeout=3)
             if response.status_code == 200:
                 logger.info("💬 Slack alert sent.")
             else:
@@ -4,14 +4,16 @@ Analytics API Router.
 Provides comprehensive system metrics, performance analytics, and reporting endpoints.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from ..database import get_db
 from ..auth import get_current_user
 from ..auth_models import User
+from ..cache import response_cache
 from ..analytics import (
     PerformanceEvaluator,
     CoverageAnalyzer,
@@ -19,13 +21,51 @@ from ..analytics import (
 )
 
 
-router = APIRouter(prefix="/api/v1/analytics", tags=["Analytics"])
+# ORJSONResponse encodes the large analytics payloads (trends arrays, per-zone
+# coverage maps, bundles) in C instead of the stdlib json encoder's Python
+# string-escaping loops.
+router = APIRouter(
+    prefix="/api/v1/analytics",
+    tags=["Analytics"],
+    default_response_class=ORJSONResponse,
+)
+
+# Endpoints here are deliberately sync (plain def): the evaluators run
+# blocking Session queries, and inside an async def those would stall the
+# event loop for every other request. As plain def FastAPI dispatches them
+# to the AnyIO threadpool, keeping the loop free; the response cache above
+# absorbs most calls before they ever reach the threadpool.
+
+# Dashboards poll these endpoints every few seconds; a short server-side TTL
+# absorbs the repeats, and Cache-Control lets the frontend skip the request
+# entirely within the same window.
+ANALYTICS_CACHE_TTL = 30
+UAV_CACHE_TTL = 5
+
+
+def time_window(
+    hours: int = Query(24, ge=1, le=720, description="Time window in hours")
+) -> Tuple[int, datetime, datetime]:
+    """Per-request time window: the clock is sampled once here and every
+    sub-query of the handler sees the same (start, end) pair instead of each
+    call site taking its own utcnow()."""
+    end_time = datetime.utcnow()
+    return hours, end_time - timedelta(hours=hours), end_time
+
+
+def get_analytics_db(db: Session = Depends(get_db)) -> Session:
+    """Analytics handlers issue several read-only statements per request;
+    REPEATABLE READ pins one MVCC snapshot for the whole transaction so the
+    counters, coverage and trend queries all agree on the same data."""
+    db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    return db
 
 
 @router.get("/performance", response_model=Dict[str, Any])
-async def get_performance_metrics(
-    hours: int = Query(24, ge=1, le=720, description="Time window in hours"),
-    db: Session = Depends(get_db),
+def get_performance_metrics(
+    response: Response,
+    window: Tuple[int, datetime, datetime] = Depends(time_window),
+    db: Session = Depends(get_analytics_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -39,16 +79,21 @@ async def get_performance_metrics(
     - Mission success rate
     """
     try:
+        hours, start_time, end_time = window
+        response.headers["Cache-Control"] = f"max-age={ANALYTICS_CACHE_TTL}"
+        cache_key = f"analytics:performance:{hours}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+        response.headers["X-Cache"] = "MISS"
+
         evaluator = PerformanceEvaluator(db)
-        
-        # Calculate time window
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
-        
+
         # Get metrics from evaluator
         metrics = evaluator.calculate_metrics(start_time, end_time)
-        
-        return {
+
+        payload = {
             "time_window_hours": hours,
             "detection_rate": round(metrics.detection_rate, 2),
             "false_positive_rate": round(metrics.false_positive_rate, 2),
@@ -61,29 +106,38 @@ async def get_performance_metrics(
             "total_detections": metrics.total_detections,
             "total_alerts": metrics.total_alerts
         }
-        
+        response_cache.set(cache_key, payload, ttl=ANALYTICS_CACHE_TTL)
+        return payload
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating metrics: {str(e)}")
 
 
 @router.get("/coverage", response_model=Dict[str, Any])
-async def get_coverage_metrics(
-    hours: int = Query(24, ge=1, le=720, description="Time window in hours"),
-    db: Session = Depends(get_db),
+def get_coverage_metrics(
+    response: Response,
+    window: Tuple[int, datetime, datetime] = Depends(time_window),
+    db: Session = Depends(get_analytics_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get coverage analysis metrics.
     """
     try:
+        hours, start_time, end_time = window
+        response.headers["Cache-Control"] = f"max-age={ANALYTICS_CACHE_TTL}"
+        cache_key = f"analytics:coverage:{hours}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+        response.headers["X-Cache"] = "MISS"
+
         analyzer = CoverageAnalyzer(db)
-        
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
-        
+
         coverage = analyzer.calculate_coverage(start_time, end_time)
-        
-        return {
+
+        payload = {
             "time_window_hours": hours,
             "total_area_km2": round(coverage.total_area_km2, 2),
             "covered_area_km2": round(coverage.covered_area_km2, 2),
@@ -92,29 +146,38 @@ async def get_coverage_metrics(
             "coverage_gaps": len(coverage.gaps),
             "coverage_by_zone": coverage.coverage_by_zone
         }
-        
+        response_cache.set(cache_key, payload, ttl=ANALYTICS_CACHE_TTL)
+        return payload
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating coverage: {str(e)}")
 
 
 @router.get("/response-time", response_model=Dict[str, Any])
-async def get_response_time_metrics(
-    hours: int = Query(24, ge=1, le=720, description="Time window in hours"),
-    db: Session = Depends(get_db),
+def get_response_time_metrics(
+    response: Response,
+    window: Tuple[int, datetime, datetime] = Depends(time_window),
+    db: Session = Depends(get_analytics_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get response time analysis.
     """
     try:
+        hours, start_time, end_time = window
+        response.headers["Cache-Control"] = f"max-age={ANALYTICS_CACHE_TTL}"
+        cache_key = f"analytics:response-time:{hours}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+        response.headers["X-Cache"] = "MISS"
+
         tracker = ResponseTimeTracker(db)
-        
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
-        
+
         response_metrics = tracker.calculate_response_times(start_time, end_time)
-        
-        return {
+
+        payload = {
             "time_window_hours": hours,
             "alert_to_assignment": round(response_metrics.alert_to_assignment, 2),
             "assignment_to_launch": round(response_metrics.assignment_to_launch, 2),
@@ -122,29 +185,42 @@ async def get_response_time_metrics(
             "total_response_time": round(response_metrics.total_response_time, 2),
             "response_time_by_priority": response_metrics.response_time_by_priority
         }
-        
+        response_cache.set(cache_key, payload, ttl=ANALYTICS_CACHE_TTL)
+        return payload
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating response times: {str(e)}")
 
 
 @router.get("/uav/{uav_id}/performance", response_model=Dict[str, Any])
-async def get_uav_performance(
+def get_uav_performance(
     uav_id: str,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_analytics_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get performance metrics for a specific UAV.
     """
     try:
+        # Per-UAV stats go stale faster than fleet-wide aggregates; short TTL
+        response.headers["Cache-Control"] = f"max-age={UAV_CACHE_TTL}"
+        cache_key = f"analytics:uav:{uav_id}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+        response.headers["X-Cache"] = "MISS"
+
         evaluator = PerformanceEvaluator(db)
         performance = evaluator.get_uav_performance(uav_id)
-        
+
         if not performance:
             raise HTTPException(status_code=404, detail=f"UAV {uav_id} not found")
-        
+
+        response_cache.set(cache_key, performance, ttl=UAV_CACHE_TTL)
         return performance
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -152,29 +228,111 @@ async def get_uav_performance(
 
 
 @router.get("/trends", response_model=Dict[str, Any])
-async def get_trends(
-    hours: int = Query(24, ge=1, le=720, description="Time window in hours"),
+def get_trends(
+    response: Response,
+    window: Tuple[int, datetime, datetime] = Depends(time_window),
     interval_hours: int = Query(1, ge=1, le=24, description="Trend interval in hours"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_analytics_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get historical trend analysis.
     """
     try:
+        hours, start_time, end_time = window
+        response.headers["Cache-Control"] = f"max-age={ANALYTICS_CACHE_TTL}"
+        cache_key = f"analytics:trends:{hours}:{interval_hours}"
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
+        response.headers["X-Cache"] = "MISS"
+
         evaluator = PerformanceEvaluator(db)
-        
-        end_time = datetime.utcnow()
-        start_time = end_time - timedelta(hours=hours)
-        
+
         trends = evaluator.get_detection_trends(start_time, end_time, interval_hours)
-        
-        return {
+
+        payload = {
             "time_window_hours": hours,
             "interval_hours": interval_hours,
             "data_points": len(trends),
             "trends": trends
         }
-        
+        response_cache.set(cache_key, payload, ttl=ANALYTICS_CACHE_TTL)
+        return payload
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating trends: {str(e)}")
+
+
+# Metric blocks the bundle endpoint can fan out to, with the defaults the
+# standalone endpoints declare via Query(...). Calling the handlers directly
+# bypasses FastAPI's parameter resolution, so defaults are merged here; a
+# None default dict marks blocks that take no time window.
+_BUNDLE_HANDLERS = {
+    "performance": (get_performance_metrics, {}),
+    "coverage": (get_coverage_metrics, {}),
+    "response_time": (get_response_time_metrics, {}),
+    "uav": (get_uav_performance, None),  # requires uav_id
+    "trends": (get_trends, {"interval_hours": 1}),
+}
+
+
+@router.post("/bundle", response_model=Dict[str, Any])
+def get_analytics_bundle(
+    requests: Dict[str, Dict[str, Any]] = Body(..., embed=True),
+    db: Session = Depends(get_analytics_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Fetch several metric blocks in one round-trip.
+
+    The dashboard renders multiple analytics panels at once; fetching them
+    individually costs one TLS/auth/session traversal per panel. This endpoint
+    accepts {"requests": {"performance": {"hours": 24}, "coverage": {}}} and
+    fans out to the same handlers server-side, sharing one DB session and one
+    auth check. Each block still goes through the response cache, so warm
+    blocks cost a dict lookup.
+
+    Returns {"results": {name: payload}, "errors": {name: detail}}; a failing
+    block lands in "errors" without sinking the rest of the bundle.
+    """
+    results: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+
+    # One clock sample shared by every block: windows of different lengths
+    # still agree on "now", and with the REPEATABLE READ session they all
+    # read the same snapshot
+    end_time = datetime.utcnow()
+
+    for name, params in requests.items():
+        entry = _BUNDLE_HANDLERS.get(name)
+        if entry is None:
+            errors[name] = f"Unknown metric block: {name}"
+            continue
+
+        handler, defaults = entry
+        params = dict(params or {})
+        if defaults is None:
+            kwargs = params
+        else:
+            hours = params.pop("hours", 24)
+            kwargs = {
+                **defaults,
+                **params,
+                "window": (hours, end_time - timedelta(hours=hours), end_time),
+            }
+        try:
+            # Throwaway Response: per-block cache headers don't apply to the
+            # combined payload
+            results[name] = handler(
+                response=Response(), db=db, current_user=current_user, **kwargs
+            )
+        except HTTPException as e:
+            errors[name] = str(e.detail)
+        except TypeError as e:
+            errors[name] = f"Invalid parameters for {name}: {str(e)}"
+        except Exception as e:
+            errors[name] = f"Error calculating {name}: {str(e)}"
+
+    return {"results": results, "errors": errors}
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -17,8 +17,7 @@ class TileResponse(TileBase):
     last_updated: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Satellite Alert Schemas
@@ -48,8 +47,7 @@ class SatelliteAlertResponse(BaseModel):
     status: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # UAV Schemas
@@ -81,8 +79,7 @@ class UAVResponse(BaseModel):
     last_seen: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Mission Schemas
@@ -106,8 +103,7 @@ class MissionResponse(BaseModel):
     end_time: Optional[datetime]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Detection Schemas
@@ -137,8 +133,7 @@ class DetectionResponse(BaseModel):
     verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Telemetry Schemas
@@ -166,6 +161,5 @@ class TelemetryResponse(BaseModel):
     status: str
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
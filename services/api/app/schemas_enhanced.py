@@ -2,7 +2,7 @@
 Enhanced Pydantic schemas for authentication, authorization, and advanced features.
 """
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -29,7 +29,14 @@ class UserLogin(BaseModel):
 
 
 class UserResponse(BaseModel):
-    """Schema for user data in responses."""
+    """Schema for user data in responses.
+
+    Validates directly from the ORM ``User`` via ``model_validate``; the
+    roles validator projects ``Role`` rows to their names so endpoints do
+    not need to build the list field-by-field.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     username: str
     email: str
@@ -39,9 +46,11 @@ class UserResponse(BaseModel):
     mfa_enabled: bool
     last_login: Optional[datetime]
     created_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    @field_validator("roles", mode="before")
+    @classmethod
+    def _role_names(cls, v):
+        return [r.name if hasattr(r, "name") else r for r in v]
 
 
 class TokenResponse(BaseModel):
@@ -82,8 +91,7 @@ class RoleResponse(BaseModel):
     description: Optional[str]
     permissions: List[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -155,8 +163,7 @@ class ZoneResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -260,6 +267,10 @@ class DetectionCreateEnhanced(BaseModel):
     track_id: Optional[str] = None  # For Kalman filter tracking
     metadata: Optional[Dict[str, Any]] = None
 
+    # Store the plain enum value at validation time so every downstream
+    # serialization and dict() access skips the enum -> .value hop
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class DetectionResponseEnhanced(BaseModel):
     """Enhanced detection response schema."""
@@ -279,8 +290,7 @@ class DetectionResponseEnhanced(BaseModel):
     metadata: Optional[Dict[str, Any]]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -328,6 +338,8 @@ class MissionCreateEnhanced(BaseModel):
     parameters: Optional[Dict[str, Any]] = None  # Mission-specific params
     estimated_duration_minutes: Optional[int] = None
 
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class MissionUpdate(BaseModel):
     """Mission update schema."""
@@ -335,6 +347,8 @@ class MissionUpdate(BaseModel):
     waypoints: Optional[List[WaypointCreate]] = None
     parameters: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class MissionResponseEnhanced(BaseModel):
     """Enhanced mission response schema."""
@@ -355,8 +369,7 @@ class MissionResponseEnhanced(BaseModel):
     detections_count: Optional[int]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -410,8 +423,7 @@ class AlertResponseEnhanced(BaseModel):
     metadata: Optional[Dict[str, Any]]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -436,8 +448,7 @@ class ConfigResponse(BaseModel):
     updated_by: Optional[str]
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -463,6 +474,8 @@ class WSMessage(BaseModel):
     timestamp: Optional[datetime] = None
     data: Optional[Dict[str, Any]] = None
 
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class WSSubscribe(BaseModel):
     """WebSocket subscription request."""
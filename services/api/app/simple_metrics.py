@@ -16,6 +16,45 @@ app = FastAPI(title="EVENT - Simple Metrics App")
 REQUEST_COUNT = Counter('http_requests_total_simple', 'Total HTTP requests', ['method', 'path', 'status_code'])
 REQUEST_LATENCY = Histogram('http_request_latency_seconds_simple', 'HTTP request latency seconds', ['method', 'path'])
 
+# .labels() hashes the label tuple and walks the metric's child map on every
+# call; bound children are immortal, so look them up once and reuse. The cap
+# keeps a flood of distinct paths from growing the caches without limit
+# (over the cap we fall back to the uncached call).
+_LABEL_CACHE_MAX = 1024
+_latency_children = {}
+_count_children = {}
+
+
+def _route_path(request: Request) -> str:
+    """Label requests with the matched route template, not the raw path.
+
+    /missions/{mission_id} stays one label no matter how many missions
+    exist; raw paths would mint a time series per resource id and blow up
+    both the label map and Prometheus.
+    """
+    route = request.scope.get("route")
+    return getattr(route, "path", request.url.path)
+
+
+def _observe_latency(method: str, path: str, duration: float):
+    key = (method, path)
+    child = _latency_children.get(key)
+    if child is None:
+        child = REQUEST_LATENCY.labels(method, path)
+        if len(_latency_children) < _LABEL_CACHE_MAX:
+            _latency_children[key] = child
+    child.observe(duration)
+
+
+def _count_request(method: str, path: str, status_code: str):
+    key = (method, path, status_code)
+    child = _count_children.get(key)
+    if child is None:
+        child = REQUEST_COUNT.labels(method, path, status_code)
+        if len(_count_children) < _LABEL_CACHE_MAX:
+            _count_children[key] = child
+    child.inc()
+
 
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):
@@ -23,13 +62,14 @@ async def metrics_middleware(request: Request, call_next):
     try:
         response = await call_next(request)
     except Exception as exc:
-        REQUEST_COUNT.labels(request.method, request.url.path, '500').inc()
+        _count_request(request.method, _route_path(request), '500')
         raise
 
     duration = time.time() - start
     try:
-        REQUEST_LATENCY.labels(request.method, request.url.path).observe(duration)
-        REQUEST_COUNT.labels(request.method, request.url.path, str(response.status_code)).inc()
+        path = _route_path(request)
+        _observe_latency(request.method, path, duration)
+        _count_request(request.method, path, str(response.status_code))
     except Exception:
         # Metrics should never break responses
         pass
@@ -42,10 +82,21 @@ def root():
     return {"message": "simple metrics app operational"}
 
 
+# Encoding the full registry is CPU-bound string formatting; with several
+# scrapers (Prometheus, Grafana agent) polling concurrently, cache the
+# exposition bytes briefly. Scrape intervals are typically 15s+, so a 1s
+# cache is invisible to collectors.
+_METRICS_TTL_S = 1.0
+_metrics_cache = [0.0, b""]
+
+
 @app.get("/metrics")
 def metrics():
     try:
-        data = generate_latest()
-        return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+        now = time.monotonic()
+        if not _metrics_cache[1] or now - _metrics_cache[0] > _METRICS_TTL_S:
+            _metrics_cache[1] = generate_latest()
+            _metrics_cache[0] = now
+        return Response(content=_metrics_cache[1], media_type=CONTENT_TYPE_LATEST)
     except Exception:
         return JSONResponse(status_code=500, content={"error": "metrics generation failed"})
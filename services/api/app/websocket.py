@@ -5,8 +5,8 @@ Implements WebSocket protocol for telemetry, detections, and alerts
 as specified in Appendix C: API & Message Protocols.
 """
 
-import json
 import asyncio
+import orjson
 from typing import Dict, Set, List
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect, Depends, status
@@ -117,7 +117,9 @@ class ConnectionManager:
         """Send message to specific WebSocket."""
         try:
             message["timestamp"] = datetime.utcnow().isoformat()
-            await websocket.send_json(message)
+            # Same orjson path as the channel broadcasts; send_json would
+            # route through the stdlib encoder
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
             logger.error(f"Error sending personal message: {e}")
     
@@ -127,11 +129,17 @@ class ConnectionManager:
             return
         
         message["timestamp"] = datetime.utcnow().isoformat()
-        
+
+        # Encode once per message, not once per subscriber: send_json would
+        # re-run JSON encoding for every client even though the bytes are
+        # identical. The single encode goes through orjson's C encoder and
+        # the fan-out loop just ships the prebuilt text frame.
+        payload = orjson.dumps(message).decode()
+
         disconnected = []
         for websocket in self.channel_subscriptions[channel]:
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(payload)
             except Exception as e:
                 logger.error(f"Error broadcasting to channel {channel}: {e}")
                 disconnected.append(websocket)
@@ -25,5 +25,9 @@ celery_app.conf.update(
             "task": "app.tasks.process_pending_alerts",
             "schedule": 60.0,  # every 60 seconds
         },
+        "refresh-analytics-views": {
+            "task": "app.tasks.refresh_analytics_views",
+            "schedule": 60.0,  # every 60 seconds
+        },
     }
 )
@@ -1,6 +1,7 @@
 from .celery_app import celery_app
-from .database import SessionLocal
+from .database import SessionLocal, engine
 from .models import SatelliteAlert, UAV
+from sqlalchemy import text
 import paho.mqtt.client as mqtt
 import json
 import os
@@ -132,3 +133,25 @@ def simulate_battery_drain():
         return f"Drained battery for {len(flying_uavs)} UAVs"
     finally:
         db.close()
+
+ANALYTICS_VIEWS = (
+    "mv_hourly_detections",
+    "mv_hourly_alerts",
+    "mv_hourly_missions",
+)
+
+@celery_app.task(name="app.tasks.refresh_analytics_views")
+def refresh_analytics_views():
+    """Refresh the hourly analytics materialized views"""
+    # CONCURRENTLY keeps dashboard readers unblocked during the refresh, but
+    # cannot run inside a transaction block - use an autocommit connection
+    refreshed = 0
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for view in ANALYTICS_VIEWS:
+            try:
+                conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+                refreshed += 1
+            except Exception as e:
+                logger.error(f"Failed to refresh {view}: {e}")
+
+    return f"Refreshed {refreshed}/{len(ANALYTICS_VIEWS)} analytics views"
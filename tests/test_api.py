@@ -94,9 +94,47 @@ def test_create_detection():
     assert data["confidence"] == 0.95
 
 
+def test_create_satellite_alert_v1():
+    # The v1 payload always carries a metadata key; it must be remapped to
+    # the meta_data column before insert().values(), which (unlike the
+    # declarative constructor) resolves a stray "metadata" kwarg to
+    # Base.metadata and raises
+    alert_data = {
+        "tile_id": "TILE_001",
+        "event_type": "fire",
+        "confidence": 0.9,
+        "latitude": 37.7749,
+        "longitude": -122.4194,
+        "severity": "high",
+        "metadata": {"source": "sat-test"}
+    }
+    response = client.post("/api/v1/sat/alerts", json=alert_data)
+    # With a database this creates the alert; without one the centralized
+    # SQLAlchemyError handler answers 503. A 500 (or an unhandled
+    # AttributeError) means the metadata remap regressed.
+    assert response.status_code in (200, 503)
+    if response.status_code == 200:
+        data = response.json()
+        assert data["event_type"] == "fire"
+        assert data["alert_id"].startswith("ALERT_")
+
+
 def test_metrics_endpoint():
     response = client.get("/metrics")
     # Prometheus text format should be returned
     assert response.status_code == 200
     content_type = response.headers.get("content-type", "")
     assert "text/plain" in content_type
+
+
+def test_mqtt_client_not_shadowed():
+    # A duplicate MQTTClient definition would silently shadow the real one
+    # (connection tracking, QoS-1 publishers) at import time
+    from services.api.app.mqtt_client import MQTTClient
+
+    mqtt = MQTTClient()
+    assert mqtt.connected is False
+    assert callable(mqtt.publish_alert)
+    assert callable(mqtt.publish_command)
+    # Backward-compatibility alias must stay wired to publish_command
+    assert callable(mqtt.publish_uav_command)